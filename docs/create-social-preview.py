@@ -7,9 +7,14 @@ Creates a 1200×630px PNG image with text:
 
 Requirements:
     pip install Pillow
+
+Usage:
+    python3 create-social-preview.py            # generate social-preview.png
+    python3 create-social-preview.py --measure  # print text sizes for TEXT_SIZES
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import argparse
 import os
 
 # Image dimensions (GitHub social preview standard)
@@ -21,7 +26,29 @@ BG_COLOR = (18, 18, 18)  # Dark gray/black
 TEXT_COLOR = (255, 147, 0)  # Bitcoin orange
 ACCENT_COLOR = (255, 255, 255)  # White for subtitle
 
-def create_social_preview():
+# Text
+TITLE = "Bitcoin Address-Collision Lab"
+SUBTITLE = "btc-brute-force"
+
+# Fonts (title, subtitle), tried in order
+MACOS_FONT = "/System/Library/Fonts/HelveticaNeue.ttc"
+LINUX_TITLE_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+LINUX_SUBTITLE_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+# Pre-measured (title width, title height, subtitle width, subtitle height)
+# keyed by title font file, as printed by --measure. Text and fonts are fixed,
+# so this skips rasterizing both strings through FreeType just to center them.
+# Fonts not listed here are measured at run time.
+TEXT_SIZES = {
+    LINUX_TITLE_FONT: (1185, 56, 360, 37),
+}
+
+def measure_text(draw, text, font):
+    # Width and height of the rendered text bounding box
+    bbox = draw.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+def create_social_preview(measure=False):
     # Create image
     img = Image.new('RGB', (WIDTH, HEIGHT), color=BG_COLOR)
     draw = ImageDraw.Draw(img)
@@ -29,36 +56,43 @@ def create_social_preview():
     # Try to use a nice font, fallback to default
     try:
         # Try system fonts (macOS)
-        title_font = ImageFont.truetype("/System/Library/Fonts/HelveticaNeue.ttc", 72)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/HelveticaNeue.ttc", 48)
+        title_font = ImageFont.truetype(MACOS_FONT, 72)
+        subtitle_font = ImageFont.truetype(MACOS_FONT, 48)
+        font_file = MACOS_FONT
     except:
         try:
             # Try Linux fonts
-            title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 72)
-            subtitle_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 48)
+            title_font = ImageFont.truetype(LINUX_TITLE_FONT, 72)
+            subtitle_font = ImageFont.truetype(LINUX_SUBTITLE_FONT, 48)
+            font_file = LINUX_TITLE_FONT
         except:
             # Fallback to default font
             title_font = ImageFont.load_default()
             subtitle_font = ImageFont.load_default()
+            font_file = None
+    
+    # Text sizes: pre-measured for known fonts, otherwise measure now
+    if measure or font_file not in TEXT_SIZES:
+        title_width, title_height = measure_text(draw, TITLE, title_font)
+        subtitle_width, subtitle_height = measure_text(draw, SUBTITLE, subtitle_font)
+    else:
+        title_width, title_height, subtitle_width, subtitle_height = TEXT_SIZES[font_file]
+    
+    if measure:
+        print(f"{font_file!r}: ({title_width}, {title_height}, {subtitle_width}, {subtitle_height}),")
+        return
     
     # Main title
-    title = "Bitcoin Address-Collision Lab"
-    title_bbox = draw.textbbox((0, 0), title, font=title_font)
-    title_width = title_bbox[2] - title_bbox[0]
-    title_height = title_bbox[3] - title_bbox[1]
     title_x = (WIDTH - title_width) // 2
     title_y = HEIGHT // 2 - title_height - 20
     
-    draw.text((title_x, title_y), title, fill=TEXT_COLOR, font=title_font)
+    draw.text((title_x, title_y), TITLE, fill=TEXT_COLOR, font=title_font)
     
     # Subtitle
-    subtitle = "btc-brute-force"
-    subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-    subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
     subtitle_x = (WIDTH - subtitle_width) // 2
     subtitle_y = title_y + title_height + 30
     
-    draw.text((subtitle_x, subtitle_y), subtitle, fill=ACCENT_COLOR, font=subtitle_font)
+    draw.text((subtitle_x, subtitle_y), SUBTITLE, fill=ACCENT_COLOR, font=subtitle_font)
     
     # Save image
     output_path = os.path.join(os.path.dirname(__file__), 'social-preview.png')
@@ -67,5 +101,9 @@ def create_social_preview():
     print(f"Dimensions: {WIDTH}×{HEIGHT}px")
 
 if __name__ == '__main__':
-    create_social_preview()
+    parser = argparse.ArgumentParser(description='Generate social preview image for GitHub repository.')
+    parser.add_argument('--measure', action='store_true',
+                        help='Print measured text sizes (a TEXT_SIZES entry) instead of generating the image')
+    args = parser.parse_args()
+    create_social_preview(measure=args.measure)
 
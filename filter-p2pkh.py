@@ -5,7 +5,9 @@ Bitcoin Address Filter - Legacy P2PKH Extractor
 Description:
 	This script filters Bitcoin addresses to extract only Legacy P2PKH addresses
 	(Pay-to-Public-Key-Hash) that start with '1'. It processes large files
-	efficiently by streaming line-by-line instead of loading entire file into memory.
+	efficiently by memory-mapping the input, scanning it in large chunks and
+	matching addresses with a single compiled regex instead of a Python loop
+	per line.
 
 Purpose:
 	Prepare address database for bitcoin-wallet-bruteforce-offline.go by removing
@@ -19,12 +21,18 @@ Address Types:
 	✗ Taproot P2TR (starts with 'bc1p') - FILTERED OUT
 
 Performance:
-	- Processes ~1M addresses per second
-	- Memory usage: constant (line-by-line processing)
+	- Processes ~2.5M lines per second on one core with the regex scanner
+	  (3M-line, 103 MiB test file); Numba, Cython and --grep are faster
+	- Memory usage: 4 MiB chunks; tens of MiB per job with -j
 	- Can handle files of any size (tested with 27M+ addresses)
+	- Optional: pip install numba for a JIT-compiled scanner (~4x faster scan,
+	  used for inputs of 128 MiB or more)
+	- Optional: build p2pkh_scanner.pyx with Cython for a compiled C scanner
 
 Cross-platform:
 	Works on macOS, Linux, and Windows without modifications.
+	Input lines may end in \\n or \\r\\n; classic Mac (bare \\r) files must be
+	converted first (e.g. tr '\\r' '\\n').
 
 Author: David Zita
 License: MIT
@@ -33,13 +41,96 @@ License: MIT
 import sys       # System-specific parameters and functions
 import argparse  # Command-line argument parsing
 import os        # Operating system interface (file operations)
+import re        # Regular expressions (whole-file address matching)
+import mmap      # Memory-mapped file access (no read() copies, OS readahead)
+import stat      # File type checks (regular file vs pipe)
+import shutil    # Locating the grep executable
+import subprocess  # Running grep as the native fast path
+from concurrent.futures import ProcessPoolExecutor  # Multi-core chunk dispatch
+
+# Optional speed boost: compiled Cython chunk scanner (see p2pkh_scanner.pyx)
+try:
+    from p2pkh_scanner import filter_chunk as filter_chunk_cython
+except ImportError:
+    filter_chunk_cython = None
+
+# Optional speed boost: Numba JIT-compiled chunk scanner (pip install numba)
+# Not imported here: numpy + numba take ~0.3 s to import, so they are only
+# loaded by load_numba_scanner() for inputs big enough to win that back.
+# The script works without them, falling back to the regex scanner.
+np = None
+BASE58_TABLE_UINT8 = None
+_filter_chunk_numba = None
+
+# Base58 alphabet used by Bitcoin (excludes 0, O, I, l to avoid visual confusion)
+# Stored as bytes so it can be passed straight to bytes.translate() as the
+# deletion set: translate() walks a 256-entry lookup table in C, the same idea
+# as Bitcoin Core's mapBase58[] table replacing strchr().
+BASE58_ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# 256-entry validity table (1 = Base58 character, 0 = anything else)
+# Built once at import as an immutable bytes singleton. Only the Numba
+# scanner uses it (as BASE58_TABLE_UINT8, a zero-copy view); the Cython
+# scanner builds its own C table in init_table()
+BASE58_TABLE = bytes(1 if byte in BASE58_ALPHABET else 0 for byte in range(256))
+
+# Whole-line P2PKH matcher, the same criteria as is_p2pkh_address() on bytes:
+# - '1' prefix followed by 25-34 Base58 characters (26-35 total)
+# - Surrounding ASCII whitespace only (space, \t, \r, \f, \v; the '\r' of
+#   Windows line endings included) is allowed but not captured. Unlike
+#   str.strip() on decoded text, non-ASCII whitespace (NBSP, NEL) and the
+#   \x1c-\x1f separators are not stripped, so such lines are rejected
+# Compiled once; findall() then tokenizes and validates a whole chunk in the
+# regex engine's C code instead of a Python loop per line.
+# The standard re module is used on purpose: google-re2 (a DFA engine) was
+# benchmarked with this pattern and its findall() ran ~6x slower, because its
+# Python binding builds every match in Python code. For a native DFA-style
+# scan, the grep fast path below is used instead.
+P2PKH_LINE_PATTERN = re.compile(
+    rb'^[ \t\r\f\v]*(1[1-9A-HJ-NP-Za-km-z]{25,34})[ \t\r\f\v]*$',
+    re.MULTILINE
+)
+
+# Input chunk size: large enough to amortize per-chunk and regex call overhead
+# over ~100K lines, small enough to keep memory usage constant
+READ_CHUNK_SIZE = 1 << 22  # 4 MiB
+
+# Output buffer size: chunks with few addresses (e.g. mostly SegWit input)
+# are coalesced into 1 MiB writes; larger outputs go straight to the OS
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# grep fast path: same match as P2PKH_LINE_PATTERN in PCRE syntax (grep -P),
+# with \K and a lookahead so grep -o prints only the address itself
+# \x0b instead of \v: in PCRE, \v is any vertical whitespace (including
+# \x85 NEL), not just the vertical tab that Python's \v means
+GREP = shutil.which('grep')
+GREP_PATTERN = r'^[ \t\r\f\x0b]*\K1[1-9A-HJ-NP-Za-km-z]{25,34}(?=[ \t\r\f\x0b]*$)'
+
+# Smallest input for which the Numba scanner is loaded: it scans 100 MiB
+# ~0.7 s faster than the regex, against ~0.4 s for importing numpy and numba
+# and loading the cached machine code, so it breaks even around 60 MiB
+# (the first run also JIT-compiles for a few seconds; hence the margin)
+NUMBA_MIN_FILE_SIZE = 1 << 27  # 128 MiB
+
+# Progress is reported each time this many more input bytes are processed
+PROGRESS_INTERVAL = 1 << 28  # 256 MiB
+
+# Byte range handed to one worker process in parallel mode (--jobs > 1)
+# Big enough to amortize inter-process transfer, small enough to balance load
+PARALLEL_CHUNK_SIZE = 1 << 24  # 16 MiB
 
 def is_p2pkh_address(address):
     """
     Validate if a Bitcoin address is Legacy P2PKH format.
     
+    Reference validator for a single address (e.g. when this script is
+    imported as a module). filter_p2pkh() does not call it: its chunk
+    scanners (P2PKH_LINE_PATTERN, Numba, Cython) apply the same criteria to
+    whole chunks of lines, so nothing here is on the filtering hot path.
+    
     Parameters:
-        address (str): Bitcoin address to check
+        address (str or bytes): Bitcoin address to check (surrounding
+                       whitespace and line endings are ignored)
     
     Returns:
         bool: True if address is valid P2PKH, False otherwise
@@ -71,71 +162,491 @@ def is_p2pkh_address(address):
         - Network byte validation
         
         For filtering purposes, this quick check is sufficient and much faster.
+
+        The alphabet check is a single bytes.translate() call (one C loop over
+        a 256-entry table). A SWAR variant (whole address packed into one
+        Python int, ASCII/range/forbidden-byte tests via 0x80-lane masks) was
+        measured ~6x slower than translate() in CPython: the big-int arithmetic
+        costs more than the per-byte C loop it replaces.
     """
     # Remove leading/trailing whitespace
-    addr = address.strip()
+    address = address.strip()
+    
+    # Text or raw bytes
+    text = isinstance(address, str)
     
-    # Reject empty strings
-    if not addr:
+    # Cheapest checks first, so most non-P2PKH input is rejected by one
+    # comparison before anything scans the whole string:
+    # - First character must be '1' (mainnet P2PKH); also rejects empty
+    #   strings, P2SH ('3...'), SegWit and Taproot ('bc1...')
+    if not address.startswith('1' if text else b'1'):
         return False
     
-    # Check P2PKH criteria:
-    # - First character must be '1' (mainnet P2PKH)
     # - Length must be in valid range (26-35 characters typical)
-    if addr[0] == '1' and 26 <= len(addr) <= 35:
-        # Verify all characters are valid Base58 (no 0, O, I, l)
-        # Base58 alphabet: 123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz
-        if all(c in '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz' for c in addr):
-            return True
+    if not 26 <= len(address) <= 35:
+        return False
+    
+    # - Text only: ASCII check with str.isascii(), which is O(1) in CPython
+    #   (the string object already records it), then encode with no error
+    #   handler. Bytes need neither: non-ASCII bytes fail the alphabet check.
+    if text:
+        if not address.isascii():
+            return False
+        address = address.encode('ascii')
+    
+    # Only survivors pay for the alphabet scan:
+    # Verify all characters are valid Base58 (no 0, O, I, l)
+    # Deleting every Base58 byte leaves an empty result only if the whole
+    # address was valid.
+    return not address.translate(None, BASE58_ALPHABET)
+
+def _scan_chunk(buf, out, table):
+    """
+    Native-code equivalent of P2PKH_LINE_PATTERN.findall() + b'\\n'.join().
+    
+    Plain Python source for Numba: load_numba_scanner() JIT-compiles it into
+    _filter_chunk_numba (never called uncompiled).
+    
+    Parameters:
+        buf (numpy.ndarray): uint8 view of a chunk of complete lines
+        out (numpy.ndarray): uint8 output buffer, at least len(buf) + 1 bytes
+        table (numpy.ndarray): uint8 view of BASE58_TABLE
+    
+    Returns:
+        tuple: (bytes written to out, number of addresses found)
+    """
+    n = buf.shape[0]
+    written = 0
+    found = 0
+    line_start = 0
+    
+    while line_start < n:
+        # Find end of line
+        line_end = line_start
+        while line_end < n and buf[line_end] != 10:
+            line_end += 1
+        
+        # Strip surrounding whitespace (space, \t, \r, \f, \v)
+        start = line_start
+        end = line_end
+        while start < end and (buf[start] == 32 or 9 <= buf[start] <= 13):
+            start += 1
+        while end > start and (buf[end - 1] == 32 or 9 <= buf[end - 1] <= 13):
+            end -= 1
+        
+        # Same P2PKH criteria as is_p2pkh_address()
+        length = end - start
+        if 26 <= length <= 35 and buf[start] == 49:
+            valid = True
+            for i in range(start, end):
+                if table[buf[i]] == 0:
+                    valid = False
+                    break
+            
+            if valid:
+                out[written:written + length] = buf[start:end]
+                written += length
+                out[written] = 10
+                written += 1
+                found += 1
+        
+        line_start = line_end + 1
+    
+    return written, found
+
+def load_numba_scanner():
+    """
+    Import Numba and JIT-compile _scan_chunk() into _filter_chunk_numba.
+    
+    Returns:
+        bool: True if the Numba scanner is available (Numba installed)
+    
+    Lazy Loading:
+        Called only for inputs of at least NUMBA_MIN_FILE_SIZE and when the
+        compiled Cython scanner is missing (see filter_p2pkh()), so small
+        inputs, grep and Cython runs never pay for importing numpy and numba.
+        Worker processes call it as the pool initializer.
+    
+    Fallbacks:
+        - Numba not installed: returns False (regex scanner)
+        - JIT cache not writable: compiled without caching (slower start-up
+          on every run, same output)
+    """
+    global np, BASE58_TABLE_UINT8, _filter_chunk_numba
+    
+    if _filter_chunk_numba is None:
+        # Numba not installed: the regex scanner is used instead
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            return False
+        
+        np = numpy
+        # Zero-copy uint8 view of BASE58_TABLE
+        BASE58_TABLE_UINT8 = np.frombuffer(BASE58_TABLE, dtype=np.uint8)
+        
+        # cache=True: the machine code is reused by later runs (no recompile)
+        # No writable cache directory (read-only install or container):
+        # Numba raises RuntimeError, so compile without the cache instead
+        try:
+            _filter_chunk_numba = njit(cache=True)(_scan_chunk)
+        except RuntimeError:
+            _filter_chunk_numba = njit(cache=False)(_scan_chunk)
+    return True
+
+def filter_chunk(chunk):
+    """
+    Extract P2PKH addresses from a chunk of complete lines.
+    
+    Parameters:
+        chunk (bytes): Raw input lines (every line ends with b'\\n', except
+                       possibly the last line of the file)
+    
+    Returns:
+        tuple: (output, number of addresses found)
+               Output (bytes-like) is the valid addresses, each followed by b'\\n'
+    
+    Implementation (first available):
+        - Compiled p2pkh_scanner extension: C loop with the GIL released
+        - Numba loaded (load_numba_scanner()): JIT-compiled scanner
+          (_filter_chunk_numba), one native loop over the chunk with no
+          Python objects per line
+        - Otherwise: P2PKH_LINE_PATTERN.findall() in the regex engine
+        
+        All produce identical output.
+    """
+    if filter_chunk_cython is not None:
+        return filter_chunk_cython(chunk)
+    
+    if _filter_chunk_numba is not None:
+        out = np.empty(len(chunk) + 1, dtype=np.uint8)
+        written, found = _filter_chunk_numba(np.frombuffer(chunk, dtype=np.uint8), out,
+                                             BASE58_TABLE_UINT8)
+        # A slice of the output buffer is written as-is (no tobytes() copy)
+        return out[:written], found
+    
+    # Validate every line of the chunk in one C-level scan
+    # (group 1 excludes surrounding whitespace)
+    addresses = P2PKH_LINE_PATTERN.findall(chunk)
+    if not addresses:
+        return b'', 0
+    
+    # One join builds the whole output in C; the empty last item supplies
+    # the final newline without copying the joined buffer again
+    found = len(addresses)
+    addresses.append(b'')
+    return b'\n'.join(addresses), found
+
+def map_input(infile):
+    """
+    Memory-map an input file read-only, hinting sequential access.
+    
+    Parameters:
+        infile (file): Input file opened in binary mode (must not be empty)
+    
+    Returns:
+        mmap.mmap: Read-only mapping of the whole file
+    
+    Why mmap:
+        The kernel pages the file in on demand and its readahead prefetches
+        the sequential scan; slicing the mapping copies a chunk once, instead
+        of read() into a buffer plus re-joining lines split across reads.
+        MADV_SEQUENTIAL (where available) makes readahead more aggressive.
+    """
+    mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+def next_line_start(mm, position):
+    """
+    Return the offset just after the first newline at or after position
+    (the length of the mapping if there is none).
+    """
+    newline = mm.find(b'\n', position)
+    return len(mm) if newline < 0 else newline + 1
+
+def read_stream(infile):
+    """
+    Read a non-mappable input (pipe, FIFO, /dev/stdin) in chunks of complete lines.
+    
+    Chunk Boundaries:
+        Each read is cut after its last newline; the partial line is carried
+        over and prepended to the next read, so no line is ever split.
+    """
+    # Partial last line of the previous chunk
+    tail = b''
+    
+    while True:
+        chunk = infile.read(READ_CHUNK_SIZE)
+        
+        # End of input: the unterminated last line (if any) is a chunk of its own
+        if not chunk:
+            if tail:
+                yield tail
+            return
+        
+        # Only yield complete lines; keep the rest for the next chunk
+        chunk = tail + chunk
+        cut = chunk.rfind(b'\n') + 1
+        chunk, tail = chunk[:cut], chunk[cut:]
+        if chunk:
+            yield chunk
+
+def read_chunks(infile):
+    """
+    Read a binary file in chunks of complete lines.
+    
+    Parameters:
+        infile (file): Input file opened in binary mode
+    
+    Yields:
+        bytes: ~READ_CHUNK_SIZE bytes ending right after a newline
+               (the unterminated last line of the file, if any, comes last)
+    
+    Chunk Boundaries:
+        Each chunk is extended past READ_CHUNK_SIZE to the end of the line it
+        stops in, so no line is ever split.
+    
+    Input Types:
+        - Regular file: memory-mapped (map_input())
+        - Pipe, FIFO, /dev/stdin, ...: st_size is 0 and mmap is not possible,
+          so it is read sequentially instead (read_stream())
+    """
+    status = os.fstat(infile.fileno())
+    if not stat.S_ISREG(status.st_mode):
+        yield from read_stream(infile)
+        return
+    
+    # mmap cannot map an empty file; there is nothing to filter anyway
+    if status.st_size == 0:
+        return
+    
+    with map_input(infile) as mm:
+        start = 0
+        while start < len(mm):
+            end = next_line_start(mm, start + READ_CHUNK_SIZE - 1)
+            yield mm[start:end]
+            start = end
+
+def count_lines(chunk):
+    """
+    Count lines in a chunk (a final line without trailing newline counts too).
+    """
+    lines = chunk.count(b'\n')
+    if chunk and not chunk.endswith(b'\n'):
+        lines += 1
+    return lines
+
+def filter_range(input_file, start, end):
+    """
+    Filter the lines starting inside one byte range of the input file.
+    
+    Runs in a worker process (parallel mode); opens its own file handle so
+    only the filtered output, never the raw lines, crosses process boundaries.
+    
+    Parameters:
+        input_file (str): Path to input file
+        start (int): First byte of the range
+        end (int): End of the range (exclusive)
+    
+    Returns:
+        tuple: (output, addresses found, lines processed, bytes processed)
+    
+    Range Ownership:
+        A line belongs to the range containing its first byte. The worker
+        skips the partial line at start (the previous range owns it) and
+        extends past end up to the next newline to finish its own last line.
+    """
+    with open(input_file, 'rb') as infile, map_input(infile) as mm:
+        # Skip to the first line starting at or after start
+        if start > 0:
+            start = next_line_start(mm, start - 1)
+        
+        # Extend to the end of the line containing the last byte of the range
+        end = next_line_start(mm, end - 1)
+        if start >= end:
+            return b'', 0, 0, 0
+        
+        chunk = mm[start:end]
+    
+    output, found = filter_chunk(chunk)
+    return output, found, count_lines(chunk), len(chunk)
+
+def filter_sequential(infile):
+    """
+    Filter an open input file chunk by chunk in the current process.
     
-    return False
+    Yields:
+        tuple: (output, addresses found, lines processed, bytes processed) per chunk
+    """
+    for chunk in read_chunks(infile):
+        output, found = filter_chunk(chunk)
+        yield output, found, count_lines(chunk), len(chunk)
 
-def filter_p2pkh(input_file, output_file):
+def filter_parallel(input_file, file_size, jobs, use_numba=False):
+    """
+    Filter the input file across multiple worker processes.
+    
+    Parameters:
+        input_file (str): Path to input file
+        file_size (int): Input size in bytes
+        jobs (int): Number of worker processes
+        use_numba (bool): Load the Numba scanner in each worker
+    
+    Yields:
+        tuple: (output, addresses found, lines processed, bytes processed) per range,
+               in file order
+    
+    Algorithm:
+        1. Split the file into PARALLEL_CHUNK_SIZE byte ranges
+        2. Each worker runs filter_range() on its ranges (own file handle)
+        3. executor.map() returns results in submission order, so output
+           order matches input order
+    """
+    starts = range(0, file_size, PARALLEL_CHUNK_SIZE)
+    ends = [min(start + PARALLEL_CHUNK_SIZE, file_size) for start in starts]
+    
+    initializer = load_numba_scanner if use_numba else None
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer) as executor:
+        yield from executor.map(filter_range, [input_file] * len(ends), starts, ends)
+
+def grep_supported():
+    """
+    Check whether the grep on PATH can run GREP_PATTERN.
+    
+    Returns:
+        bool: True if grep exists and supports -P (PCRE) patterns
+    
+    Platform Notes:
+        - GNU grep (Linux, Git for Windows): supported
+        - BSD grep (macOS default): no -P, falls back to the Python scanner
+    """
+    if GREP is None:
+        return False
+    
+    # Exit status 1 means "no match" (pattern accepted), 2 means error
+    probe = subprocess.run([GREP, '-P', GREP_PATTERN],
+                           input=b'', stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return probe.returncode < 2
+
+def filter_grep(input_file):
+    """
+    Filter the input file with grep, a natively compiled line matcher.
+    
+    Parameters:
+        input_file (str): Path to input file
+    
+    Yields:
+        tuple: (output, addresses found, 0, 0); output blocks are streamed
+               from grep's stdout as they arrive. grep does not report how
+               much input it read, so lines and bytes are not counted (no
+               progress, and no line total in the summary)
+    
+    Command:
+        LC_ALL=C grep -a -o -P GREP_PATTERN -- input_file
+        - LC_ALL=C: byte-wise matching, no UTF-8 decoding
+        - -a: treat the input as text even if it contains binary bytes
+        - -o -P: print only the address (whitespace and \\r excluded)
+    
+    Raises:
+        OSError: grep exited with an error
+    """
+    # '--' ends grep's options, so names like '-x.txt' are taken as files;
+    # a bare '-' would still mean stdin to grep, so it is passed as './-'
+    if input_file == '-':
+        input_file = os.path.join(os.curdir, input_file)
+    
+    process = subprocess.Popen([GREP, '-a', '-o', '-P', GREP_PATTERN, '--', input_file],
+                               stdout=subprocess.PIPE,
+                               env=dict(os.environ, LC_ALL='C'))
+    
+    with process.stdout:
+        while True:
+            output = process.stdout.read(READ_CHUNK_SIZE)
+            if not output:
+                break
+            yield output, output.count(b'\n'), 0, 0
+    
+    # grep exit status: 0 = matches, 1 = no matches, 2 = error
+    if process.wait() > 1:
+        raise OSError(f"grep failed with exit status {process.returncode}")
+
+def filter_p2pkh(input_file, output_file, jobs=1, use_grep=False):
     """
     Filter P2PKH addresses from input file and write to output file.
     
     Parameters:
         input_file (str): Path to input file containing Bitcoin addresses (one per line)
         output_file (str): Path to output file for filtered P2PKH addresses
+        jobs (int): Number of worker processes (1 = single process)
+        use_grep (bool): Use grep when it supports GREP_PATTERN (see filter_grep());
+                         jobs is ignored and no progress or line count is shown
     
     Algorithm:
-        1. Open input and output files simultaneously
-        2. Read input line-by-line (streaming, not loading into memory)
-        3. Validate each address using is_p2pkh_address()
-        4. Write valid P2PKH addresses to output file
-        5. Display progress every 1 million lines
-        6. Print final statistics
+        0. use_grep and grep_supported(): grep does steps 1-2 in a single
+           process, its output is streamed to the output file
+        1. Otherwise split input into chunks of complete lines:
+           - jobs == 1: 4 MiB slices of a memory-mapped input (read_chunks())
+           - jobs > 1: 16 MiB byte ranges filtered by worker processes
+             (filter_parallel()), results collected in file order
+        2. Extract all P2PKH addresses of each chunk with filter_chunk()
+        3. Write each chunk's addresses with a single write()
+        4. Display progress every 256 MiB of input (PROGRESS_INTERVAL)
+        5. Print final statistics
     
     Memory Efficiency:
-        - Streaming approach: Only one line in memory at a time
+        - Chunked approach: Only a few chunks in memory at a time
         - Can handle files of any size (tested with 27M+ lines)
-        - Memory usage: constant (~few MB) regardless of file size
+        - Memory usage:
+          * jobs == 1: one 4 MiB chunk plus its output at a time
+          * jobs > 1: each worker holds a 16 MiB range plus up to 16 MiB of
+            output (~32 MiB per job), and the parent keeps every finished
+            executor.map() result until it has been written (only a few
+            while writing keeps up with the workers)
+        - Pages of the memory-mapped input count toward the process RSS,
+          but they are page cache the OS can reclaim at any time
         - Alternative approach (load all into memory) would require:
           * 27M addresses × ~50 bytes = ~1.35 GB RAM
     
     Cross-platform File Handling:
-        Input (newline=''):
-            - Python auto-detects line endings (Unix \\n, Windows \\r\\n, Mac \\r)
-            - Universal newline mode ensures compatibility
-        
-        Output (newline='\\n'):
+        Input (binary):
+            - Unix (\\n) and Windows (\\r\\n) line endings are both accepted;
+              the trailing \\r is treated as whitespace by the pattern
+            - Classic Mac (bare \\r) line endings are NOT supported: lines are
+              split on \\n only, so such a file is one long line and yields no
+              addresses. Convert it first, e.g. tr '\\r' '\\n' < in > out
+
+        Output (binary):
             - Forces Unix-style line endings (\\n)
             - Consistent output format on all platforms
             - Compatible with Go program expectations
     
     Encoding:
-        - UTF-8: Universal text encoding (Bitcoin addresses are ASCII subset)
-        - errors='ignore': Skip any malformed UTF-8 sequences (rare in address lists)
+        - None: the file is scanned as raw bytes (Bitcoin addresses are ASCII)
+        - Lines containing non-ASCII bytes simply do not match
+        - Only ASCII whitespace (space, \\t, \\r, \\f, \\v) around an address is
+          stripped. Lines padded with non-ASCII whitespace (UTF-8 NBSP, NEL)
+          or \\x1c-\\x1f, which str.strip() on decoded text used to remove,
+          are now rejected
+        - Lines with invalid UTF-8 bytes are rejected too; the old text-mode
+          reader (errors='ignore') dropped those bytes silently and kept the
+          rest of the line
     
     Progress Reporting:
-        - Updates every 1M lines to stderr (doesn't interfere with output)
-        - Allows user to monitor progress on large files
+        - Updates every 256 MiB of input to stderr (doesn't interfere with output)
+        - Bytes, not lines: meaningful percentage for any line length
+        - Checked once per chunk (a single comparison), nothing per line
         - Flush ensures immediate display (not buffered)
     
     Performance:
-        - Processes ~1M addresses per second (CPU-dependent)
-        - 27M addresses completed in ~30-40 seconds
-        - Bottleneck: I/O and string validation, not CPU
+        - Line splitting and validation run in native code: the regex engine,
+          or the Numba JIT scanner when Numba is installed and the input is
+          at least NUMBA_MIN_FILE_SIZE (128 MiB)
+        - One slice of the mmap and one write() per chunk instead of per line
+        - Lines are independent, so parallel mode scales with core count
     
     Error Handling:
         Handled by caller (try-except block wraps this function)
@@ -143,51 +654,79 @@ def filter_p2pkh(input_file, output_file):
     # Initialize counters
     total_lines = 0     # Total lines read from input
     p2pkh_count = 0     # Number of valid P2PKH addresses found
+    bytes_read = 0      # Input bytes processed so far
+    next_report = PROGRESS_INTERVAL   # Byte count at which to print the next progress update
     
     try:
         # Open both files simultaneously using context managers
         # Both files will be automatically closed when block exits
         
-        # INPUT FILE (read mode):
-        # - encoding='utf-8': Standard text encoding
-        # - errors='ignore': Skip invalid UTF-8 bytes (continue processing)
-        # - newline='': Universal newline mode (handles \\n, \\r\\n, \\r)
+        # INPUT FILE (binary read mode):
+        # - Memory-mapped and sliced into large chunks, scanned as raw bytes
         
-        # OUTPUT FILE (write mode):
-        # - encoding='utf-8': Match input encoding
-        # - newline='\\n': Force Unix line endings (cross-platform consistency)
+        # OUTPUT FILE (binary write mode):
+        # - Matches are already ASCII bytes, written with b'\n' line endings
+        # - No text codec layer; 1 MiB buffer (WRITE_BUFFER_SIZE)
         
-        with open(input_file, 'r', encoding='utf-8', errors='ignore', newline='') as infile, \
-             open(output_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        with open(input_file, 'rb') as infile, \
+             open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as outfile:
+            
+            # Small files are not worth starting worker processes for
+            file_size = os.fstat(infile.fileno()).st_size
+            parallel = jobs > 1 and file_size > PARALLEL_CHUNK_SIZE
+            
+            # Numba only wins back its import cost on big inputs, and is not
+            # needed at all when the Cython scanner is available
+            use_numba = filter_chunk_cython is None and file_size >= NUMBA_MIN_FILE_SIZE
             
-            # Process file line-by-line (streaming)
-            # enumerate() provides line numbers starting from 1
-            for line_num, line in enumerate(infile, 1):
-                total_lines += 1
+            # grep fast path (opt-in); without -P support, use the Python scanner
+            grep = use_grep and grep_supported()
+            if use_grep and not grep:
+                print("grep with -P support not found, using the Python scanner", file=sys.stderr)
+            
+            if grep:
+                results = filter_grep(input_file)
+            elif parallel:
+                results = filter_parallel(input_file, file_size, jobs, use_numba)
+            else:
+                if use_numba:
+                    load_numba_scanner()
+                results = filter_sequential(infile)
+            
+            # Local reference: skips the attribute lookup on every write
+            write = outfile.write
+            
+            for output, found, lines, size in results:
+                # Write all valid addresses of the chunk at once
+                if found:
+                    write(output)
+                    p2pkh_count += found
+                total_lines += lines
+                bytes_read += size
                 
-                # Progress indicator: Print update every 1 million lines
+                # Progress indicator: Print update every 256 MiB of input
                 # Output to stderr to separate from main output
                 # flush=True ensures immediate display (not buffered)
-                if line_num % 1000000 == 0:
-                    print(f"Processed {line_num:,} lines, found {p2pkh_count:,} P2PKH addresses...", 
+                if bytes_read >= next_report:
+                    # Pipes have no known size (st_size 0): no percentage
+                    percent = f" ({bytes_read * 100 // file_size}%)" if file_size else ""
+                    print(f"Processed {bytes_read >> 20:,} MiB{percent}, "
+                          f"{total_lines:,} lines, found {p2pkh_count:,} P2PKH addresses...", 
                           file=sys.stderr, flush=True)
-                
-                # Validate address
-                if is_p2pkh_address(line):
-                    # Write valid address to output file
-                    # strip() removes leading/trailing whitespace
-                    # Add newline for proper formatting
-                    outfile.write(line.strip() + '\n')
-                    p2pkh_count += 1
+                    next_report = (bytes_read // PROGRESS_INTERVAL + 1) * PROGRESS_INTERVAL
             
             # Print completion summary
             print(f"\n✓ Filtering complete!", file=sys.stderr)
-            print(f"  Total lines processed: {total_lines:,}", file=sys.stderr)
+            if grep:
+                print(f"  Total lines processed: not counted (grep)", file=sys.stderr)
+            else:
+                print(f"  Total lines processed: {total_lines:,}", file=sys.stderr)
             print(f"  P2PKH addresses found: {p2pkh_count:,}", file=sys.stderr)
             print(f"  Output saved to: {output_file}", file=sys.stderr)
             
-    except FileNotFoundError:
-        print(f"Error: File '{input_file}' not found.", file=sys.stderr)
+    except FileNotFoundError as e:
+        # e.filename tells whether the input or the output path is missing
+        print(f"Error: File '{e.filename or input_file}' not found.", file=sys.stderr)
         sys.exit(1)
     except PermissionError:
         print(f"Error: Permission denied. Cannot read '{input_file}' or write to '{output_file}'.", file=sys.stderr)
@@ -205,10 +744,10 @@ def main():
     
     Workflow:
         1. Parse command-line arguments
-        2. Validate input file existence
-        3. Normalize file paths (cross-platform)
-        4. Execute filtering operation
-        5. Display results
+        2. Normalize file paths (cross-platform)
+        3. Execute filtering operation (a missing input file is reported
+           by filter_p2pkh() when opening it, no separate existence check)
+        4. Display results
     
     Command-line Interface:
         Required:
@@ -216,6 +755,9 @@ def main():
         
         Optional:
             -o, --output: Path to output file (default: attack-addresses-p2pkh.txt)
+            -j, --jobs: Number of worker processes (default: CPU core count)
+            --grep: Use grep (GNU grep with -P) instead of the Python scanner;
+                    -j is ignored, no progress and no line count are shown
     
     Exit Codes:
         0: Success
@@ -243,6 +785,8 @@ def main():
                'Examples:\n'
                '  python filter-p2pkh.py addresses.txt\n'
                '  python filter-p2pkh.py addresses.txt -o output.txt\n'
+               '  python filter-p2pkh.py addresses.txt -j 1 (single process)\n'
+               '  python filter-p2pkh.py addresses.txt --grep (GNU grep, -j ignored)\n'
                '  python3 filter-p2pkh.py addresses.txt\n'
                '  py filter-p2pkh.py addresses.txt (Windows)\n'
                '\n'
@@ -261,6 +805,18 @@ def main():
                        default='attack-addresses-p2pkh.txt',
                        help='Output file for filtered addresses (default: attack-addresses-p2pkh.txt)')
     
+    # Optional argument: number of worker processes
+    parser.add_argument('-j', '--jobs', 
+                       type=int,
+                       default=os.cpu_count() or 1,
+                       help='Number of worker processes (default: number of CPU cores)')
+    
+    # Optional flag: enable the grep fast path
+    parser.add_argument('--grep', 
+                       action='store_true',
+                       help='Scan with grep -P (GNU grep) instead of the Python scanner; '
+                            '-j is ignored and no progress or line count is shown')
+    
     # Parse command-line arguments
     args = parser.parse_args()
     
@@ -275,16 +831,6 @@ def main():
     input_file = os.path.normpath(args.input_file)
     output_file = os.path.normpath(args.output)
     
-    # ========================================================================
-    # INPUT VALIDATION
-    # ========================================================================
-    
-    # Check if input file exists before starting processing
-    # Fail fast to avoid wasting time on non-existent file
-    if not os.path.exists(input_file):
-        print(f"Error: Input file '{input_file}' does not exist.", file=sys.stderr)
-        sys.exit(1)
-    
     # ========================================================================
     # STATUS INFORMATION
     # ========================================================================
@@ -299,7 +845,7 @@ def main():
     
     # Call main filtering function
     # Exceptions are handled within filter_p2pkh() function
-    filter_p2pkh(input_file, output_file)
+    filter_p2pkh(input_file, output_file, max(1, args.jobs), args.grep)
 
 if __name__ == '__main__':
     main()
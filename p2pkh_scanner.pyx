@@ -0,0 +1,108 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled P2PKH chunk scanner - optional accelerator for filter-p2pkh.py
+
+Description:
+	C implementation of filter-p2pkh.py's filter_chunk(): one tight loop over a
+	chunk of lines with a static 256-entry Base58 table, no Python objects per
+	line and the GIL released while scanning.
+
+Build (optional, from the repository root):
+	pip install cython
+	CFLAGS="-O3 -march=native" cythonize -i -a p2pkh_scanner.pyx
+
+	filter-p2pkh.py picks up the compiled module automatically when it is
+	importable, and falls back to Numba or the regex scanner otherwise.
+
+Author: David Zita
+License: MIT
+"""
+
+# 256-entry validity table (1 = Base58 character, 0 = anything else)
+# A 128-bit membership bitmask (two uint64 halves, branchless select/shift)
+# was benchmarked as a replacement and ran at the same speed: this 256-byte
+# table stays in L1 cache, so the load it would save is not a bottleneck.
+cdef unsigned char BASE58_TABLE[256]
+
+cdef void init_table():
+    cdef const unsigned char[:] alphabet = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+    cdef Py_ssize_t i
+    for i in range(256):
+        BASE58_TABLE[i] = 0
+    for i in range(alphabet.shape[0]):
+        BASE58_TABLE[alphabet[i]] = 1
+
+init_table()
+
+cdef inline bint is_space(unsigned char c) noexcept nogil:
+    # Same set as str.strip() for ASCII: space, \t, \r, \f, \v (\n ends the line)
+    return c == 32 or 9 <= c <= 13
+
+cdef Py_ssize_t scan(const unsigned char* buf, Py_ssize_t n,
+                     unsigned char* out, Py_ssize_t* found) noexcept nogil:
+    cdef Py_ssize_t written = 0
+    cdef Py_ssize_t line_start = 0
+    cdef Py_ssize_t line_end, start, end, length, i
+    cdef bint valid
+
+    while line_start < n:
+        # Find end of line
+        line_end = line_start
+        while line_end < n and buf[line_end] != 10:
+            line_end += 1
+
+        # Strip surrounding whitespace
+        start = line_start
+        end = line_end
+        while start < end and is_space(buf[start]):
+            start += 1
+        while end > start and is_space(buf[end - 1]):
+            end -= 1
+
+        # Same P2PKH criteria as is_p2pkh_address()
+        length = end - start
+        if 26 <= length <= 35 and buf[start] == 49:
+            valid = True
+            for i in range(start, end):
+                if BASE58_TABLE[buf[i]] == 0:
+                    valid = False
+                    break
+
+            if valid:
+                for i in range(length):
+                    out[written + i] = buf[start + i]
+                written += length
+                out[written] = 10
+                written += 1
+                found[0] += 1
+
+        line_start = line_end + 1
+
+    return written
+
+def filter_chunk(const unsigned char[::1] chunk):
+    """
+    Extract P2PKH addresses from a chunk of complete lines.
+
+    Parameters:
+        chunk (bytes): Raw input lines
+
+    Returns:
+        tuple: (output, number of addresses found)
+               Output (bytearray) is the valid addresses, each followed by b'\\n'
+    """
+    cdef Py_ssize_t n = chunk.shape[0]
+    cdef Py_ssize_t found = 0
+    cdef Py_ssize_t written
+
+    if n == 0:
+        return b'', 0
+
+    out = bytearray(n + 1)
+    cdef unsigned char* out_ptr = out
+
+    with nogil:
+        written = scan(&chunk[0], n, out_ptr, &found)
+
+    del out[written:]
+    return out, found